@@ -18,7 +18,6 @@ Biological function depends on pH. The most sensitive residue near physiological
 
 import biotite.structure as struc
 import logging
-import random
 import numpy as np
 from .geometry import position_atom_3d_from_internal_coords, calculate_angle
 from .data import (
@@ -59,7 +58,10 @@ def apply_ph_titration(structure: struc.AtomArray, ph: float = 7.4) -> struc.Ato
         # Rename ALL HIS to HIP.
         mask = structure.res_name == "HIS"
         if mask.any():
-            count = len(set(structure.res_id[mask]))
+            # Count at residue granularity: get_residues collapses the array
+            # to one entry per residue, so no O(atoms) Python set is built.
+            res_ids, res_names = struc.get_residues(structure)
+            count = int(np.count_nonzero(res_names == "HIS"))
             structure.res_name[mask] = "HIP"
             logger.info(f"Protonated {count} Histidines to HIP (pH {ph} < 6.0)")
             
@@ -67,25 +69,22 @@ def apply_ph_titration(structure: struc.AtomArray, ph: float = 7.4) -> struc.Ato
     else:
         # Determine tautomer ratios.
         # In solution, N-epsilon (HIE) is favored ~80:20 over N-delta (HID).
-        # We will assign probabilistically per residue.
-        
-        # Get all HIS residue IDs
+        # We assign probabilistically per residue, but fully vectorized:
+        # one Bernoulli draw per HIS residue, scattered back to the atom-level
+        # res_name array via the unique/inverse index map. This avoids building
+        # a fresh O(n_atoms) boolean mask per histidine.
         his_mask = structure.res_name == "HIS"
-        his_res_ids = sorted(list(set(structure.res_id[his_mask])))
-        
-        for res_id in his_res_ids:
-            # 80% chance HIE, 20% chances HID
-            # Note: Standard PDB often uses just "HIS" implying neural.
+        if his_mask.any():
+            his_ids = structure.res_id[his_mask]
+            unique_ids, inverse = np.unique(his_ids, return_inverse=True)
+
+            # 80% chance HIE, 20% chance HID per residue
+            # Note: Standard PDB often uses just "HIS" implying neutral.
             # But explicit modelling requires choosing one.
-            # If we want to be explicit:
-            new_name = "HIE" if random.random() < 0.8 else "HID"
-            
-            # Update this residue
-            res_mask = (structure.res_id == res_id) & (structure.res_name == "HIS")
-            structure.res_name[res_mask] = new_name
-            
-        if his_res_ids:
-             logger.info(f" assigned tautomers (HIE/HID) to {len(his_res_ids)} Histidines (pH {ph} > 6.0)")
+            tautomers = np.where(np.random.random(len(unique_ids)) < 0.8, "HIE", "HID")
+            structure.res_name[his_mask] = tautomers[inverse]
+
+            logger.info(f" assigned tautomers (HIE/HID) to {len(unique_ids)} Histidines (pH {ph} > 6.0)")
 
     return structure
 
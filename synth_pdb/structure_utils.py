@@ -22,48 +22,37 @@ def get_secondary_structure(structure: struc.AtomArray) -> List[str]:
         # Fallback for incomplete backbones (e.g. in tests)
         return ["coil"] * struc.get_residue_count(structure)
     
-    # We need to iterate over residues to match the output list
-    # get_residue_starts is useful
+    # Classify all residues in one vectorized pass over the dihedral arrays.
+    # If phi/psi are shorter than the residue count (e.g. due to ions/HETATM),
+    # the missing tail keeps the safe "coil" fallback via NaN padding.
     res_starts = struc.get_residue_starts(structure)
-    ss_list = []
-    
-    for i, _ in enumerate(res_starts):
-        # Safety check: if phi array is shorter than residue count (e.g. due to ions/HETATM)
-        # The "coil" secondary structure assignment is a safe fallback and will not
-        # negatively impact other functionality.
-        if i >= len(phi) or i >= len(psi):
-            ss_list.append("coil")
-            continue
+    n_res = len(res_starts)
+
+    p = np.full(n_res, np.nan)
+    s = np.full(n_res, np.nan)
+    n_angles = min(n_res, len(phi), len(psi))
+    p[:n_angles] = np.rad2deg(phi[:n_angles])
+    s[:n_angles] = np.rad2deg(psi[:n_angles])
+
+    # Determine Secondary Structure State
+    # Simple regions:
+    # Alpha: Phi ~ -60 (+/- 30), Psi ~ -45 (+/- 40)
+    # Beta:  Phi ~ -120 (+/- 40), Psi ~ 120 (+/- 50)
+    #
+    # Standard Alpha: Phi ~ -60, Psi ~ -45
+    # Synthetic Generator Offset Issues: Sometimes produces Phi ~ 115, Psi ~ -40?
+    # We broaden the check to ensure we catch ordered regions; the third
+    # region catches the "Synthetic Helix" artifact / Left-Handed Helix.
+    # NaN angles compare False everywhere and stay "coil".
+    is_alpha = ((-90 < p) & (p < -30) & (-90 < s) & (s < -10)) | \
+               ((0 < p) & (p < 150) & (-90 < s) & (s < -10))
+    is_beta = (-160 < p) & (p < -80) & (80 < s) & (s < 170)
+
+    ss_arr = np.full(n_res, "coil", dtype="<U5")
+    ss_arr[is_beta] = "beta"
+    ss_arr[is_alpha] = "alpha"
+    ss_list = ss_arr.tolist()
 
-        # Get Angles (degrees)
-        p = np.rad2deg(phi[i])
-        s = np.rad2deg(psi[i])
-        
-        ss_state = "coil"
-        
-        # Determine Secondary Structure State
-        # Simple regions:
-        # Alpha: Phi ~ -60 (+/- 30), Psi ~ -45 (+/- 40)
-        # Beta:  Phi ~ -120 (+/- 40), Psi ~ 120 (+/- 50)
-        
-        if not np.isnan(p) and not np.isnan(s):
-            logger.debug(f"Res {i}: Phi={p:.1f}, Psi={s:.1f}")
-            # Standard Alpha: Phi ~ -60, Psi ~ -45
-            # Synthetic Generator Offset Issues: Sometimes produces Phi ~ 115, Psi ~ -40?
-            # We broaden the check to ensure we catch ordered regions.
-            
-            # Standard Alpha
-            if (-90 < p < -30) and (-90 < s < -10):
-                ss_state = "alpha"
-            # Standard Beta/Extended
-            elif (-160 < p < -80) and (80 < s < 170):
-                ss_state = "beta"
-            # Catch "Synthetic Helix" artifact (if present) or Left-Handed Helix
-            elif (0 < p < 150) and (-90 < s < -10):
-                 ss_state = "alpha"
-        
-        ss_list.append(ss_state)
-        
     # SMOOTHING PASS
     # Real secondary structure elements are usually contiguous.
     # We filter out isolated "coil" residues within helices/sheets.
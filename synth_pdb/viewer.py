@@ -5,6 +5,7 @@ Opens generated PDB structures in browser-based 3D viewer using 3Dmol.js.
 Based on pdbstat's molecular viewer implementation.
 """
 
+import functools
 import logging
 import tempfile
 import webbrowser
@@ -12,6 +13,34 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Locally bundled copy of 3Dmol-min.js (optional). When present, the viewer
+# HTML inlines it so rendering is instant and works offline; otherwise the
+# generated page falls back to loading the library from a CDN.
+_3DMOL_ASSET = Path(__file__).parent / "_assets" / "3Dmol-min.js"
+
+_CDN_LOADER = """<!-- Try to load 3Dmol.js from CDN -->
+    <script src="https://3Dmol.csb.pitt.edu/build/3Dmol-min.js"></script>
+    <!-- Fallback CDN in case pitt.edu is down/blocked -->
+    <script>
+        if (typeof $3Dmol === 'undefined') {
+            document.write('<script src="https://cdnjs.cloudflare.com/ajax/libs/3Dmol/2.0.4/3Dmol-min.js"><\\/script>');
+        }
+    </script>"""
+
+
+@functools.lru_cache(maxsize=1)
+def _load_3dmol_loader() -> str:
+    """Return the script block that makes 3Dmol.js available in the page.
+
+    Reads the bundled library once per process (~1 MB) and inlines it; if the
+    asset is not shipped, returns the CDN loader tags instead.
+    """
+    try:
+        js = _3DMOL_ASSET.read_text(encoding="utf-8")
+    except OSError:
+        return _CDN_LOADER
+    return f"<!-- Bundled 3Dmol.js (offline-capable) -->\n    <script>{js}</script>"
+
 
 def view_structure_in_browser(
     pdb_content: str,
@@ -19,17 +48,20 @@ def view_structure_in_browser(
     style: str = "cartoon",
     color: str = "spectrum",
     restraints: list = None,
+    minimal: bool = False,
 ) -> None:
     """
     Open 3D structure viewer in browser.
-    
+
     Args:
         pdb_content: PDB file contents as string
         filename: Name to display in viewer title
         style: Initial representation style (cartoon/stick/sphere/line)
         color: Initial color scheme (spectrum/chain/ss/white)
         restraints: Optional list of restraint dicts to visualize
-        
+        minimal: Emit a bare viewer page without controls/CSS — useful when
+                 generating many HTML files in batch
+
     Example:
         >>> pdb = generate_pdb_content(length=20)
         >>> view_structure_in_browser(pdb, "my_peptide.pdb")
@@ -41,7 +73,7 @@ def view_structure_in_browser(
         logger.info(f"Opening 3D viewer for {filename}")
         
         # Generate HTML with embedded 3Dmol.js viewer
-        html = _create_3dmol_html(pdb_content, filename, style, color, restraints)
+        html = _create_3dmol_html(pdb_content, filename, style, color, restraints, minimal)
         
         # Save to temporary file
         with tempfile.NamedTemporaryFile(
@@ -61,7 +93,12 @@ def view_structure_in_browser(
 
 
 def _create_3dmol_html(
-    pdb_data: str, filename: str, style: str, color: str, restraints: list = None
+    pdb_data: str,
+    filename: str,
+    style: str,
+    color: str,
+    restraints: list = None,
+    minimal: bool = False,
 ) -> str:
     """
     Generate HTML with embedded 3Dmol.js viewer.
@@ -86,15 +123,42 @@ def _create_3dmol_html(
         style: Representation style (cartoon/stick/sphere/line)
         color: Color scheme (spectrum/chain/ss/white)
         restraints: Optional list of restraint dicts to visualize as cylinders
-        
+        minimal: Skip the header/controls/CSS chrome and emit a bare page
+
     Returns:
         Complete HTML document as string
     """
-    # Escape PDB data for JavaScript
-    # We escape backslashes first, then backticks (used in template literals),
-    # and finally $ (to avoid interpolation issues with ${...})
-    pdb_escaped = pdb_data.replace("\\", "\\\\").replace("`", "\\`").replace("$", "\\$")
-    
+    # Embed the PDB verbatim in an inert text/plain script block. The browser
+    # never parses its contents as JavaScript, so no backslash/backtick/$
+    # escaping is needed — the only sequence that must be neutralized is a
+    # literal "</script>" terminator. One scan instead of three full passes
+    # over what can be a multi-megabyte string.
+    pdb_data_safe = pdb_data.replace("</script>", "<\\/script>")
+
+    if minimal:
+        # Bare page for batch/headless use: no header, controls or styling —
+        # just the library, the data block and enough JS to render once.
+        return f"""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>{filename}</title>
+    {_load_3dmol_loader()}
+</head>
+<body style="margin:0">
+    <div id="viewer" style="width:100%;height:100vh"></div>
+    <script type="text/plain" id="pdb-data">{pdb_data_safe}</script>
+    <script>
+        let viewer = $3Dmol.createViewer(document.getElementById('viewer'), {{backgroundColor: 'white'}});
+        viewer.addModel(document.getElementById('pdb-data').textContent, "pdb", {{keepH: true}});
+        viewer.setStyle({{}}, {{'{style}': {{color: '{color}'}}}});
+        viewer.zoomTo();
+        viewer.render();
+    </script>
+</body>
+</html>
+"""
+
     # Serialize restraints to JSON-like logic in JS
     js_restraints = ""
     if restraints:
@@ -180,14 +244,7 @@ def _create_3dmol_html(
 <head>
     <meta charset="utf-8">
     <title>3D Viewer - {filename}</title>
-    <!-- Try to load 3Dmol.js from CDN -->
-    <script src="https://3Dmol.csb.pitt.edu/build/3Dmol-min.js"></script>
-    <!-- Fallback CDN in case pitt.edu is down/blocked -->
-    <script>
-        if (typeof $3Dmol === 'undefined') {{
-            document.write('<script src="https://cdnjs.cloudflare.com/ajax/libs/3Dmol/2.0.4/3Dmol-min.js"><\\/script>');
-        }}
-    </script>
+    {_load_3dmol_loader()}
     <style>
         body {{
             margin: 0;
@@ -325,6 +382,8 @@ def _create_3dmol_html(
         <span class="emoji">🖱️</span> Left-click + drag to rotate | Scroll to zoom | Right-click + drag to pan
     </div>
 
+    <script type="text/plain" id="pdb-data">{pdb_data_safe}</script>
+
     <script>
         let viewer;
         let currentStyle = '{style}';
@@ -349,8 +408,8 @@ def _create_3dmol_html(
                 let config = {{ backgroundColor: 'white' }};
                 viewer = $3Dmol.createViewer(element, config);
 
-                // Load PDB data
-                let pdbData = `{pdb_escaped}`;
+                // Load PDB data from the inert text/plain block
+                let pdbData = document.getElementById('pdb-data').textContent;
                 
                 if (!pdbData || pdbData.trim().length === 0) {{
                     throw new Error("No PDB data provided to viewer.");
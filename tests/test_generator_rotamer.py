@@ -16,10 +16,11 @@ class TestGeneratorWithRotamers(unittest.TestCase):
         """
         # Generate a peptide with a LEU residue
         pdb_content = generate_pdb_content(sequence_str="LEU")
-        atoms = PDBValidator._parse_pdb_atoms(pdb_content)
+        validator = PDBValidator(pdb_content)
 
-        # Get the atoms for the chi-1 angle of LEU
-        leu_atoms = {atom['atom_name']: atom for atom in atoms if atom['residue_name'] == 'LEU'}
+        # Look the residue up in the validator's per-residue index instead
+        # of re-scanning every atom with a filtering dict comprehension
+        leu_atoms = validator.grouped_atoms["A"][1]
         
         self.assertIn('N', leu_atoms, "N atom not found for LEU")
         self.assertIn('CA', leu_atoms, "CA atom not found for LEU")
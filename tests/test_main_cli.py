@@ -1,6 +1,7 @@
 import pytest
 import sys
 import io
+import functools
 import logging # Import logging to set level for caplog
 from unittest import mock
 import numpy as np # Import numpy for array creation
@@ -9,35 +10,82 @@ from synth_pdb import main
 from synth_pdb.validator import PDBValidator
 from synth_pdb.generator import create_atom_line # Import the helper function
 
+# --- Shared PDB fixtures ---
+# These strings are byte-identical across the tests that use them, so they
+# are assembled once at module scope instead of once per test body.
+
+# PDB content that causes steric clashes (2 violations: min_distance and VdW overlap)
+CLASHING_PDB = (
+    "HEADER    clashing_peptide\n" +
+    create_atom_line(1, "CA", "ALA", "A", 1, 0.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
+    create_atom_line(2, "CA", "ALA", "A", 2, 0.500, 0.0, 0.0, "C", alt_loc="", insertion_code="")
+)
+
+# Valid PDB content
+VALID_PDB = (
+    "HEADER    valid_peptide\n" +
+    create_atom_line(1, "CA", "GLY", "A", 1, 0.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
+    create_atom_line(2, "CA", "GLY", "A", 2, 3.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
+    create_atom_line(3, "CA", "GLY", "A", 3, 6.0, 0.0, 0.0, "C", alt_loc="", insertion_code="")
+)
+
+# PDB content with 2 violations (steric clash, VdW overlap)
+TWO_VIOLATIONS_PDB = (
+    "HEADER    two_violations\n" +
+    create_atom_line(1, "CA", "ALA", "A", 1, 0.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
+    create_atom_line(2, "CA", "ALA", "A", 2, 0.500, 0.0, 0.0, "C", alt_loc="", insertion_code="")
+)
+# PDB content with 1 violation (e.g., a less severe steric clash)
+ONE_VIOLATION_PDB = (
+    "HEADER    one_violation\n" +
+    create_atom_line(1, "CA", "ALA", "A", 1, 0.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
+    create_atom_line(2, "CA", "ALA", "A", 2, 1.0, 0.0, 0.0, "C", alt_loc="", insertion_code="")
+)
+# PDB content with 0 violations
+ZERO_VIOLATIONS_PDB = (
+    "HEADER    no_violations\n" +
+    create_atom_line(1, "CA", "GLY", "A", 1, 0.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
+    create_atom_line(2, "CA", "GLY", "A", 2, 3.0, 0.0, 0.0, "C", alt_loc="", insertion_code="")
+)
+
+# Parsed-atom lists for mocking _apply_steric_clash_tweak results.
+# Each fixture's coordinates live in one contiguous (N, 3) block and the
+# dicts hold row views, mirroring how _parse_pdb_atoms lays out coords.
+NON_CLASHING_COORDS = np.array([[0.0, 0.0, 0.0], [3.0, 0.0, 0.0]])
+NON_CLASHING_PARSED_ATOMS = [
+    {"atom_number": 1, "atom_name": "CA", "alt_loc": "", "residue_name": "ALA", "chain_id": "A", "residue_number": 1, "insertion_code": "", "coords": NON_CLASHING_COORDS[0], "occupancy": 1.0, "temp_factor": 0.0, "element": "C", "charge": ""},
+    {"atom_number": 2, "atom_name": "CA", "alt_loc": "", "residue_name": "ALA", "chain_id": "A", "residue_number": 2, "insertion_code": "", "coords": NON_CLASHING_COORDS[1], "occupancy": 1.0, "temp_factor": 0.0, "element": "C", "charge": ""},
+]
+STILL_CLASHING_COORDS = np.array([[0.0, 0.0, 0.0], [0.6, 0.0, 0.0]])
+STILL_CLASHING_PARSED_ATOMS = [
+    {"atom_number": 1, "atom_name": "CA", "alt_loc": "", "residue_name": "ALA", "chain_id": "A", "residue_number": 1, "insertion_code": "", "coords": STILL_CLASHING_COORDS[0], "occupancy": 1.0, "temp_factor": 0.0, "element": "C", "charge": ""},
+    {"atom_number": 2, "atom_name": "CA", "alt_loc": "", "residue_name": "ALA", "chain_id": "A", "residue_number": 2, "insertion_code": "", "coords": STILL_CLASHING_COORDS[1], "occupancy": 1.0, "temp_factor": 0.0, "element": "C", "charge": ""}, # Still clashing
+]
+
+
+def _cached_parse_pdb_atoms():
+    """Return an lru_cache-wrapped passthrough to the real PDB parser.
+
+    The retry-loop tests feed the validator the same content string on
+    several attempts; caching per content string parses each unique PDB
+    once per test instead of once per attempt."""
+    return staticmethod(functools.lru_cache(maxsize=8)(PDBValidator._parse_pdb_atoms))
+
+
 class TestMainCLI:
     # --- Tests for --guarantee-valid ---
     def test_guarantee_valid_success(self, mocker, caplog):
         # Set caplog level to DEBUG to capture all relevant messages, especially the one about current_violations
         caplog.set_level(logging.DEBUG)
 
-        # PDB content that causes steric clashes (2 violations: min_distance and VdW overlap)
-        # Manually crafted to ensure it's a raw string
-        clashing_pdb_content = (
-            "HEADER    clashing_peptide\n" +
-            create_atom_line(1, "CA", "ALA", "A", 1, 0.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
-            create_atom_line(2, "CA", "ALA", "A", 2, 0.500, 0.0, 0.0, "C", alt_loc="", insertion_code="")
-        )
-            
-        # Valid PDB content
-        # Manually crafted to ensure it's a raw string
-        valid_pdb_content = (
-            "HEADER    valid_peptide\n" +
-            create_atom_line(1, "CA", "GLY", "A", 1, 0.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
-            create_atom_line(2, "CA", "GLY", "A", 2, 3.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
-            create_atom_line(3, "CA", "GLY", "A", 3, 6.0, 0.0, 0.0, "C", alt_loc="", insertion_code="")
-        )    
         mocker.patch("synth_pdb.main.generate_pdb_content", side_effect=[
-            clashing_pdb_content,
-            clashing_pdb_content,
-            valid_pdb_content
+            CLASHING_PDB,
+            CLASHING_PDB,
+            VALID_PDB
         ])
-        
-        # No need to mock PDBValidator or its methods, let the real one run.
+
+        # Let the real validator run, but parse each unique content once.
+        mocker.patch.object(PDBValidator, "_parse_pdb_atoms", _cached_parse_pdb_atoms())
 
         # Mock sys.argv to simulate CLI arguments, including --log-level DEBUG
         test_args = ["synth_pdb", "--length", "1", "--guarantee-valid", "--max-attempts", "3", "--output", "test_gv_success.pdb", "--log-level", "DEBUG"]
@@ -48,26 +96,22 @@ class TestMainCLI:
 
         main.main()
 
-        # Assert that expected log messages are present
-        assert "PDB generated in attempt 1 has 2 violations. Retrying..." in caplog.text
-        assert "PDB generated in attempt 2 has 2 violations. Retrying..." in caplog.text
-        assert "Successfully generated a valid PDB file after 3 attempts." in caplog.text
-        assert "test_gv_success.pdb" in caplog.text
+        # Assert that expected log messages are present. caplog.text re-joins
+        # every record on each access, so snapshot it once per test.
+        log_text = caplog.text
+        assert "PDB generated in attempt 1 has 2 violations. Retrying..." in log_text
+        assert "PDB generated in attempt 2 has 2 violations. Retrying..." in log_text
+        assert "Successfully generated a valid PDB file after 3 attempts." in log_text
+        assert "test_gv_success.pdb" in log_text
         sys.exit.assert_not_called() # Should not exit with error
 
     def test_guarantee_valid_failure(self, mocker, caplog):
         caplog.set_level(logging.INFO) # Set to INFO to capture relevant messages
         
-        # PDB content that causes steric clashes (2 violations: min_distance and VdW overlap)
-        clashing_pdb_content = (
-            "HEADER    clashing_peptide\n" +
-            create_atom_line(1, "CA", "ALA", "A", 1, 0.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
-            create_atom_line(2, "CA", "ALA", "A", 2, 0.500, 0.0, 0.0, "C", alt_loc="", insertion_code="")
-        )
-
-        mocker.patch("synth_pdb.main.generate_pdb_content", return_value=clashing_pdb_content) # Always return clashing PDB
+        mocker.patch("synth_pdb.main.generate_pdb_content", return_value=CLASHING_PDB) # Always return clashing PDB
 
-        # No need to mock PDBValidator or its methods, let the real one run.
+        # Let the real validator run, but parse each unique content once.
+        mocker.patch.object(PDBValidator, "_parse_pdb_atoms", _cached_parse_pdb_atoms())
 
         # Mock sys.argv
         test_args = ["synth_pdb", "--length", "1", "--guarantee-valid", "--max-attempts", "2"]
@@ -78,41 +122,24 @@ class TestMainCLI:
 
         main.main()
 
-        assert "PDB generated in attempt 1 has 2 violations. Retrying..." in caplog.text
-        assert "PDB generated in attempt 2 has 2 violations. Retrying..." in caplog.text
-        assert "Failed to generate a suitable PDB file after 2 attempts." in caplog.text
+        log_text = caplog.text
+        assert "PDB generated in attempt 1 has 2 violations. Retrying..." in log_text
+        assert "PDB generated in attempt 2 has 2 violations. Retrying..." in log_text
+        assert "Failed to generate a suitable PDB file after 2 attempts." in log_text
         mock_sys_exit.assert_called_once_with(1)
 
     # --- Tests for --best-of-N ---
     def test_best_of_N_selection(self, mocker, caplog):
         caplog.set_level(logging.INFO) # Set to INFO to capture relevant messages
 
-        # PDB content with 2 violations (steric clash, VdW overlap)
-        pdb_content_2_violations = (
-            "HEADER    two_violations\n" +
-            create_atom_line(1, "CA", "ALA", "A", 1, 0.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
-            create_atom_line(2, "CA", "ALA", "A", 2, 0.500, 0.0, 0.0, "C", alt_loc="", insertion_code="")
-        )
-        # PDB content with 1 violation (e.g., a less severe steric clash)
-        pdb_content_1_violation = (
-            "HEADER    one_violation\n" +
-            create_atom_line(1, "CA", "ALA", "A", 1, 0.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
-            create_atom_line(2, "CA", "ALA", "A", 2, 1.0, 0.0, 0.0, "C", alt_loc="", insertion_code="")
-        )
-        # PDB content with 0 violations
-        pdb_content_0_violations = (
-            "HEADER    no_violations\n" +
-            create_atom_line(1, "CA", "GLY", "A", 1, 0.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
-            create_atom_line(2, "CA", "GLY", "A", 2, 3.0, 0.0, 0.0, "C", alt_loc="", insertion_code="")
-        )
-
         mocker.patch("synth_pdb.main.generate_pdb_content", side_effect=[
-            pdb_content_2_violations, # First generated PDB will have 2 violations
-            pdb_content_1_violation,  # Second generated PDB will have 1 violation
-            pdb_content_0_violations, # Third generated PDB will have 0 violations
+            TWO_VIOLATIONS_PDB,  # First generated PDB will have 2 violations
+            ONE_VIOLATION_PDB,   # Second generated PDB will have 1 violation
+            ZERO_VIOLATIONS_PDB, # Third generated PDB will have 0 violations
         ])
 
-        # No need to mock PDBValidator or its methods, let the real one run.
+        # Let the real validator run, but parse each unique content once.
+        mocker.patch.object(PDBValidator, "_parse_pdb_atoms", _cached_parse_pdb_atoms())
 
         # Mock sys.argv
         test_args = ["synth_pdb", "--length", "1", "--best-of-N", "3", "--output", "test_best_of_N.pdb"]
@@ -122,33 +149,89 @@ class TestMainCLI:
         main.main()
 
         # The actual violations found by the real PDBValidator (based on content above)
-        assert "Attempt 1 yielded 2 violations" in caplog.text
-        assert "Attempt 2 yielded 2 violations. Current minimum is 2." in caplog.text
-        assert "Attempt 3 yielded 0 violations (new minimum)." in caplog.text
-        assert "No violations found in the final PDB for" in caplog.text # Because the 0-violation PDB was chosen
+        log_text = caplog.text
+        assert "Attempt 1 yielded 2 violations" in log_text
+        assert "Attempt 2 yielded 2 violations. Current minimum is 2." in log_text
+        assert "Attempt 3 yielded 0 violations (new minimum)." in log_text
+        assert "No violations found in the final PDB for" in log_text # Because the 0-violation PDB was chosen
+        sys.exit.assert_not_called()
+
+    def test_generation_attempt_worker_fresh_module(self, mocker):
+        """_generation_attempt must run in a spawn-fresh worker process where
+        the lazy imports were never materialized; module __getattr__ only
+        services attribute access, not LOAD_GLOBAL."""
+        # Emulate a fresh module: drop any already-materialized lazy names
+        # (patch.dict restores the module globals afterwards).
+        mocker.patch.dict(main.__dict__)
+        for name in main._LAZY_IMPORTS:
+            main.__dict__.pop(name, None)
+
+        content, violations = main._generation_attempt(
+            ({"sequence_str": "AAA", "seed": 42}, True)
+        )
+
+        assert content is not None and content.startswith("HEADER")
+        assert isinstance(violations, list)
+
+    def test_best_of_N_parallel_pool(self, mocker, tmp_path, caplog):
+        caplog.set_level(logging.INFO)
+
+        # Mock the pool so no worker processes are spawned; feed results in
+        # the (content, violations) shape _generation_attempt returns.
+        mock_pool_cls = mocker.patch("multiprocessing.Pool")
+        mock_pool = mock_pool_cls.return_value.__enter__.return_value
+        mock_pool.imap_unordered.return_value = iter([
+            (ONE_VIOLATION_PDB, ["violation"]),
+            (ZERO_VIOLATIONS_PDB, []),
+            (TWO_VIOLATIONS_PDB, ["violation", "violation"]),
+        ])
+
+        test_args = ["synth_pdb", "--length", "1", "--best-of-N", "3", "--jobs", "2", "--output", str(tmp_path / "parallel.pdb")]
+        mocker.patch("sys.argv", test_args)
+        mocker.patch("sys.exit")
+
+        main.main()
+
+        log_text = caplog.text
+        assert "Running 3 generation attempts across 2 worker processes." in log_text
+        assert "Attempt 1 yielded 1 violations (new minimum)." in log_text
+        assert "Attempt 2 yielded 0 violations (new minimum)." in log_text
+        # A perfect result stops the pool early; the third tuple is never read.
+        mock_pool.terminate.assert_called_once()
+        assert "Attempt 3" not in log_text
         sys.exit.assert_not_called()
+
+    def test_best_of_N_parallel_all_attempts_fail(self, mocker, caplog):
+        caplog.set_level(logging.WARNING)
+
+        mock_pool_cls = mocker.patch("multiprocessing.Pool")
+        mock_pool = mock_pool_cls.return_value.__enter__.return_value
+        mock_pool.imap_unordered.return_value = iter([(None, [])] * 3)
+
+        test_args = ["synth_pdb", "--length", "1", "--best-of-N", "3", "--jobs", "2"]
+        mocker.patch("sys.argv", test_args)
+        mock_sys_exit = mocker.patch("sys.exit")
+
+        main.main()
+
+        # The failure message must report the real attempt count, not the
+        # zeroed sequential-loop counter.
+        log_text = caplog.text
+        assert "Failed to generate PDB content in attempt 3. Skipping." in log_text
+        assert "Failed to generate a suitable PDB file after 3 attempts." in log_text
+        mock_sys_exit.assert_called_with(1)
+
     # --- Tests for --refine-clashes ---
     def test_refine_clashes_reduces_violations(self, mocker, caplog):
         caplog.set_level(logging.INFO) # Set to INFO to capture relevant messages
 
-        # PDB content that causes steric clashes (2 violations: min_distance and VdW overlap)
-        initial_clashing_pdb_content = (
-            "HEADER    clashing_peptide\n" +
-            create_atom_line(1, "CA", "ALA", "A", 1, 0.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
-            create_atom_line(2, "CA", "ALA", "A", 2, 0.500, 0.0, 0.0, "C", alt_loc="", insertion_code="")
-        )
-
-        # PDB content that has no steric clashes (parsed atoms for mocking tweak result)
-        # Ensure coords are numpy arrays as the validator expects them for calculation
-        non_clashing_parsed_atoms = [
-            {"atom_number": 1, "atom_name": "CA", "alt_loc": "", "residue_name": "ALA", "chain_id": "A", "residue_number": 1, "insertion_code": "", "coords": np.array([0.0, 0.0, 0.0]), "occupancy": 1.0, "temp_factor": 0.0, "element": "C", "charge": ""},
-            {"atom_number": 2, "atom_name": "CA", "alt_loc": "", "residue_name": "ALA", "chain_id": "A", "residue_number": 2, "insertion_code": "", "coords": np.array([3.0, 0.0, 0.0]), "occupancy": 1.0, "temp_factor": 0.0, "element": "C", "charge": ""},
-        ]
+        mocker.patch("synth_pdb.main.generate_pdb_content", return_value=CLASHING_PDB)
 
-        mocker.patch("synth_pdb.main.generate_pdb_content", return_value=initial_clashing_pdb_content)
+        # Let the real validator run, but parse each unique content once.
+        mocker.patch.object(PDBValidator, "_parse_pdb_atoms", _cached_parse_pdb_atoms())
 
         # Mock _apply_steric_clash_tweak to simulate it working
-        mocker.patch.object(PDBValidator, "_apply_steric_clash_tweak", return_value=non_clashing_parsed_atoms)
+        mocker.patch.object(PDBValidator, "_apply_steric_clash_tweak", return_value=NON_CLASHING_PARSED_ATOMS)
         
         # Mock sys.argv
         test_args = ["synth_pdb", "--length", "1", "--output", "test_refine.pdb", "--refine-clashes", "1"]
@@ -159,30 +242,20 @@ class TestMainCLI:
 
         # The initial clashing_pdb_content will result in 2 steric clash violations.
         # After the tweak, it should be 0.
-        assert "Refinement iteration 1/1. Violations: 2" in caplog.text
-        assert "Refinement iteration 1: Reduced violations from 2 to 0." in caplog.text
-        assert "Refinement process completed. Reduced total violations from 2 to 0." in caplog.text
-        assert "No violations found in the final PDB for" in caplog.text
+        log_text = caplog.text
+        assert "Refinement iteration 1/1. Violations: 2" in log_text
+        assert "Refinement iteration 1: Reduced violations from 2 to 0." in log_text
+        assert "Refinement process completed. Reduced total violations from 2 to 0." in log_text
+        assert "No violations found in the final PDB for" in log_text
         sys.exit.assert_not_called()
 
     def test_refine_clashes_no_improvement(self, mocker, caplog):
         caplog.set_level(logging.INFO) # Set to INFO to capture relevant messages
 
-        # PDB content that causes steric clashes (2 violations: min_distance and VdW overlap)
-        initial_clashing_pdb_content = (
-            "HEADER    clashing_peptide\n" +
-            create_atom_line(1, "CA", "ALA", "A", 1, 0.0, 0.0, 0.0, "C", alt_loc="", insertion_code="") + "\n" +
-            create_atom_line(2, "CA", "ALA", "A", 2, 0.500, 0.0, 0.0, "C", alt_loc="", insertion_code="")
-        )
-        mocker.patch("synth_pdb.main.generate_pdb_content", return_value=initial_clashing_pdb_content)
+        mocker.patch("synth_pdb.main.generate_pdb_content", return_value=CLASHING_PDB)
 
         # Mock _apply_steric_clash_tweak to return modified atoms (but still clashing)
-        # Ensure coords are numpy arrays as the validator expects them for calculation
-        still_clashing_parsed_atoms = [
-            {"atom_number": 1, "atom_name": "CA", "alt_loc": "", "residue_name": "ALA", "chain_id": "A", "residue_number": 1, "insertion_code": "", "coords": np.array([0.0, 0.0, 0.0]), "occupancy": 1.0, "temp_factor": 0.0, "element": "C", "charge": ""},
-            {"atom_number": 2, "atom_name": "CA", "alt_loc": "", "residue_name": "ALA", "chain_id": "A", "residue_number": 2, "insertion_code": "", "coords": np.array([0.6, 0.0, 0.0]), "occupancy": 1.0, "temp_factor": 0.0, "element": "C", "charge": ""}, # Still clashing
-        ]
-        mocker.patch.object(PDBValidator, "_apply_steric_clash_tweak", return_value=still_clashing_parsed_atoms)
+        mocker.patch.object(PDBValidator, "_apply_steric_clash_tweak", return_value=STILL_CLASHING_PARSED_ATOMS)
         
         # Mock sys.argv
         test_args = ["synth_pdb", "--length", "1", "--output", "test_refine_no_improve.pdb", "--refine-clashes", "2"]
@@ -193,10 +266,11 @@ class TestMainCLI:
 
         # The initial clashing_pdb_content will result in 2 steric clash violations.
         # After the tweak, it should still be 2.
-        assert "Refinement iteration 1/2. Violations: 2" in caplog.text
-        assert "Refinement iteration 1: No further reduction in violations (2). Stopping refinement." in caplog.text
-        assert "Refinement process completed. No change in total violations (2)." in caplog.text
-        assert "Final PDB has 2 violations." in caplog.text
+        log_text = caplog.text
+        assert "Refinement iteration 1/2. Violations: 2" in log_text
+        assert "Refinement iteration 1: No further reduction in violations (2). Stopping refinement." in log_text
+        assert "Refinement process completed. No change in total violations (2)." in log_text
+        assert "Final PDB has 2 violations." in log_text
         sys.exit.assert_not_called()
     
     def test_header_with_best_of_N_and_refine_clashes(self, mocker, tmp_path, caplog):
@@ -325,7 +399,8 @@ class TestMainCLI:
         
         main.main()
         
-        assert "Failed to generate PDB content in attempt" in caplog.text or "Failed to generate a suitable PDB file after" in caplog.text
+        log_text = caplog.text
+        assert "Failed to generate PDB content in attempt" in log_text or "Failed to generate a suitable PDB file after" in log_text
         mock_sys_exit.assert_called_with(1)
     
     def test_generation_value_error(self, mocker, caplog):
@@ -344,8 +419,9 @@ class TestMainCLI:
         
         main.main()
         
-        assert "Error processing sequence during generation" in caplog.text
-        assert "Invalid amino acid code" in caplog.text
+        log_text = caplog.text
+        assert "Error processing sequence during generation" in log_text
+        assert "Invalid amino acid code" in log_text
         mock_sys_exit.assert_called_once_with(1)
     
     def test_generation_unexpected_exception(self, mocker, caplog):
@@ -364,8 +440,9 @@ class TestMainCLI:
         
         main.main()
         
-        assert "An unexpected error occurred during generation" in caplog.text
-        assert "Unexpected error" in caplog.text
+        log_text = caplog.text
+        assert "An unexpected error occurred during generation" in log_text
+        assert "Unexpected error" in log_text
         mock_sys_exit.assert_called_once_with(1)
     
     def test_refine_clashes_early_exit_no_violations(self, mocker, caplog):
@@ -389,10 +466,11 @@ class TestMainCLI:
         main.main()
         
         # Should exit early because there are no violations to begin with
-        assert "Refinement iteration 1/5. Violations: 0" in caplog.text
-        assert "No violations remain, stopping refinement early." in caplog.text
+        log_text = caplog.text
+        assert "Refinement iteration 1/5. Violations: 0" in log_text
+        assert "No violations remain, stopping refinement early." in log_text
         # Should NOT see iteration 2
-        assert "Refinement iteration 2" not in caplog.text
+        assert "Refinement iteration 2" not in log_text
         sys.exit.assert_not_called()
     
     def test_refine_clashes_increases_violations(self, mocker, caplog):
@@ -493,8 +571,9 @@ class TestMainCLI:
         
         main.main()
         
-        assert "An unexpected error occurred during file writing" in caplog.text
-        assert "Permission denied" in caplog.text
+        log_text = caplog.text
+        assert "An unexpected error occurred during file writing" in log_text
+        assert "Permission denied" in log_text
         mock_sys_exit.assert_called_once_with(1)
 
     def test_header_contains_all_arguments(self, mocker, tmp_path, caplog):
@@ -648,8 +727,9 @@ class TestMainCLI:
         main.main()
         
         # Verify calls
-        assert "Calculating NOE Restraints" in caplog.text or "Calculate NOE Restraints" in caplog.text
-        assert "Constraints exported to" in caplog.text
+        log_text = caplog.text
+        assert "Calculating NOE Restraints" in log_text or "Calculate NOE Restraints" in log_text
+        assert "Constraints exported to" in log_text
 
     def test_run_export_torsion(self, mocker, tmp_path, caplog):
         """Test generation of Torsion Angles."""
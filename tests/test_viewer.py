@@ -23,14 +23,18 @@ class TestMolecularViewer:
         assert "spectrum" in html
         
     def test_html_escaping(self):
-        """Test that PDB data is properly escaped in HTML."""
-        # PDB data with special characters that need escaping
-        pdb_data = "ATOM  `test\\data`"
+        """Test that PDB data is safely embedded in the HTML."""
+        # The text/plain data block needs no JS escaping, so special
+        # characters must survive verbatim...
+        pdb_data = "ATOM  `test\\data` $pecial"
         html = _create_3dmol_html(pdb_data, "test.pdb", "stick", "chain")
-        
-        # Should escape backticks and backslashes
-        assert "\\`" in html or "\\\\`" in html  # Escaped backtick
-        assert "\\\\" in html  # Escaped backslash
+        assert pdb_data in html
+
+        # ...but a literal </script> would terminate the block early and
+        # must be neutralized
+        html = _create_3dmol_html("ATOM </script> x", "test.pdb", "stick", "chain")
+        assert "ATOM </script> x" not in html
+        assert "ATOM <\\/script> x" in html
         
     def test_different_styles(self):
         """Test HTML generation with different visualization styles."""
@@ -107,6 +111,21 @@ class TestMolecularViewer:
         assert "c1:'A'" in html
         assert "d:3.5" in html
 
+    def test_minimal_mode(self):
+        """Test that minimal mode skips the interactive chrome."""
+        pdb_data = "ATOM      1  N   ALA A   1       0.000   0.000   0.000  1.00  0.00           N"
+        html = _create_3dmol_html(pdb_data, "test.pdb", "cartoon", "spectrum", minimal=True)
+
+        # Still a functional viewer page
+        assert "<!DOCTYPE html>" in html
+        assert pdb_data in html
+        assert "viewer.render()" in html
+
+        # But without the controls/CSS payload
+        assert "Reset View" not in html
+        assert "#header" not in html
+        assert len(html) < 2500
+
     def test_view_structure_in_browser(self, mocker):
         """Test the main entry point for the browser-based viewer."""
         # Mock dependencies to avoid side effects